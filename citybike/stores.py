@@ -0,0 +1,177 @@
+"""
+Columnar (structure-of-arrays) stores for bulk analytics.
+
+A list of Bike/Trip objects costs one attribute lookup per field per
+row; these stores keep each field in a single NumPy array instead, so
+the numerical routines can consume a column directly with zero
+conversion. Objects are still available one-at-a-time via to_bike() /
+to_trip_row() for the rare caller that needs them.
+"""
+
+import numpy as np
+import pandas as pd
+
+from models import Bike, BikeStatus, ClassicBike, ElectricBike
+
+
+# ---------------------------------------------------------------------------
+# Categorical codes — int8 columns instead of repeated strings
+# ---------------------------------------------------------------------------
+
+BIKE_TYPE_CODES = {"classic": 0, "electric": 1}
+STATUS_CODES = {status.name.lower(): int(status) for status in BikeStatus}
+
+_BIKE_TYPE_NAMES = {code: name for name, code in BIKE_TYPE_CODES.items()}
+_STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+
+# ---------------------------------------------------------------------------
+# BikeStore
+# ---------------------------------------------------------------------------
+
+class BikeStore:
+    """Fleet data as parallel NumPy columns.
+
+    Attributes:
+        ids: Bike identifiers (object dtype).
+        types: Bike type codes per BIKE_TYPE_CODES (int8).
+        statuses: Status codes per STATUS_CODES (int8).
+        batteries: Battery levels in percent, 100.0 where missing (float32).
+        gears: Gear counts, 7 where missing (int16).
+    """
+
+    __slots__ = ("ids", "types", "statuses", "batteries", "gears")
+
+    def __init__(self, ids, types, statuses, batteries, gears) -> None:
+        self.ids = np.asarray(ids, dtype=object)
+        self.types = np.asarray(types, dtype=np.int8)
+        self.statuses = np.asarray(statuses, dtype=np.int8)
+        self.batteries = np.asarray(batteries, dtype=np.float32)
+        self.gears = np.asarray(gears, dtype=np.int16)
+
+    def __len__(self) -> int:
+        return self.ids.shape[0]
+
+    @staticmethod
+    def _encode(column: pd.Series, codes: dict) -> np.ndarray:
+        # .map turns unknown values into NaN; casting NaN to int8 would
+        # silently produce garbage codes, so fail loudly instead
+        mapped = column.map(codes)
+        if mapped.isna().any():
+            # key=repr keeps the sort type-stable when NaN and unknown
+            # strings appear in the same column
+            bad = sorted(column[mapped.isna()].unique(), key=repr)
+            raise ValueError(f"Unknown {column.name}: {bad}")
+        return mapped.to_numpy(np.int8)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "BikeStore":
+        n = len(df)
+        # A mixed-fleet frame leaves NaN in the other type's column
+        # (gear_count on electric rows, battery_level on classic rows);
+        # fill the documented defaults before the integer casts
+        return cls(
+            ids=df["bike_id"].to_numpy(dtype=object),
+            types=cls._encode(df["bike_type"], BIKE_TYPE_CODES),
+            statuses=(
+                cls._encode(df["status"], STATUS_CODES)
+                if "status" in df.columns else np.zeros(n, dtype=np.int8)
+            ),
+            batteries=(
+                df["battery_level"].fillna(100.0).to_numpy(np.float32)
+                if "battery_level" in df.columns
+                else np.full(n, 100.0, dtype=np.float32)
+            ),
+            gears=(
+                df["gear_count"].fillna(7).to_numpy(np.int16)
+                if "gear_count" in df.columns
+                else np.full(n, 7, dtype=np.int16)
+            ),
+        )
+
+    @classmethod
+    def from_csv(cls, path) -> "BikeStore":
+        return cls.from_dataframe(pd.read_csv(path))
+
+    def to_bike(self, i: int) -> Bike:
+        # Lazy object view for the rare caller that wants an instance
+        status = _STATUS_NAMES[int(self.statuses[i])]
+        if self.types[i] == BIKE_TYPE_CODES["electric"]:
+            return ElectricBike(
+                bike_id=self.ids[i],
+                battery_level=float(self.batteries[i]),
+                status=status,
+            )
+        return ClassicBike(
+            bike_id=self.ids[i],
+            gear_count=int(self.gears[i]),
+            status=status,
+        )
+
+
+# ---------------------------------------------------------------------------
+# TripStore
+# ---------------------------------------------------------------------------
+
+class TripStore:
+    """Trip data as parallel NumPy columns.
+
+    durations and distances feed trip_duration_stats / calculate_fares
+    directly, without iterating Trip objects.
+
+    Attributes:
+        ids: Trip identifiers (object dtype).
+        user_ids: User identifiers (object dtype).
+        bike_ids: Bike identifiers (object dtype).
+        start_station_ids: Start station identifiers (object dtype).
+        end_station_ids: End station identifiers (object dtype).
+        durations: Trip durations in minutes (float64).
+        distances: Trip distances in km (float64).
+    """
+
+    __slots__ = (
+        "ids",
+        "user_ids",
+        "bike_ids",
+        "start_station_ids",
+        "end_station_ids",
+        "durations",
+        "distances",
+    )
+
+    def __init__(
+        self,
+        ids,
+        user_ids,
+        bike_ids,
+        start_station_ids,
+        end_station_ids,
+        durations,
+        distances,
+    ) -> None:
+        self.ids = np.asarray(ids, dtype=object)
+        self.user_ids = np.asarray(user_ids, dtype=object)
+        self.bike_ids = np.asarray(bike_ids, dtype=object)
+        self.start_station_ids = np.asarray(start_station_ids, dtype=object)
+        self.end_station_ids = np.asarray(end_station_ids, dtype=object)
+        self.durations = np.asarray(durations, dtype=np.float64)
+        self.distances = np.asarray(distances, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.ids.shape[0]
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "TripStore":
+        return cls(
+            ids=df["trip_id"].to_numpy(dtype=object),
+            user_ids=df["user_id"].to_numpy(dtype=object),
+            bike_ids=df["bike_id"].to_numpy(dtype=object),
+            start_station_ids=df["start_station_id"].to_numpy(dtype=object),
+            end_station_ids=df["end_station_id"].to_numpy(dtype=object),
+            durations=df["duration_minutes"].to_numpy(np.float64),
+            distances=df["distance_km"].to_numpy(np.float64),
+        )
+
+    @classmethod
+    def from_csv(cls, path) -> "TripStore":
+        return cls.from_dataframe(pd.read_csv(path))
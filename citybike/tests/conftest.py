@@ -0,0 +1,54 @@
+"""
+Shared pytest configuration for the test suite.
+
+Importing the heavyweight application modules here makes their cost a
+one-off paid at collection start: models pulls in datetime/enum, and
+numerical pulls in numpy, scipy, numexpr and the numba kernels (whose
+on-disk JIT cache is loaded at import). Every test module's own
+`from models import ...` / `from numerical import ...` then resolves
+as a cached sys.modules hit instead of re-executing the module.
+"""
+
+import os
+
+# Must run before numerical (and therefore numba) is first imported:
+# in the default fast mode the numba kernels execute as plain Python,
+# so the suite never pays JIT compilation for its tiny arrays. Run with
+# CITYBIKE_TEST_MODE=full to exercise the compiled path; compiled
+# artifacts are then kept in .numba_cache across runs.
+if os.environ.get("CITYBIKE_TEST_MODE", "fast") == "fast":
+    os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+else:
+    os.environ.setdefault("NUMBA_CACHE_DIR", ".numba_cache")
+
+import pytest
+
+import models  # noqa: F401
+import numerical  # noqa: F401
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow (heavy object-graph setup)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: heavy-setup model tests")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Deterministic order keeps parametrizations of one class adjacent,
+    # so pytest-xdist (pytest -n auto) schedules them onto the same
+    # worker and module/class-scoped fixtures are reused, not rebuilt
+    items.sort(key=lambda item: item.nodeid)
+
+    if not config.getoption("--fast"):
+        return
+    skip_slow = pytest.mark.skip(reason="skipped by --fast")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -2,13 +2,24 @@
 Unit tests for the factory module.
 
 Covers:
-    - create_bike (fully implemented)
+    - create_bike
+    - create_user
 """
 
+from datetime import datetime
+
+import pandas as pd
 import pytest
 
-from factories import create_bike
-from models import ClassicBike, ElectricBike, Bike
+from factories import (
+    create_bike,
+    create_bikes_bulk,
+    create_user,
+    create_users_bulk,
+    create_users_from_dataframe,
+    make_bike_builder,
+)
+from models import ClassicBike, ElectricBike, Bike, CasualUser, MemberUser, User
 
 
 # ---------------------------------------------------------------------------
@@ -58,3 +69,252 @@ class TestCreateBike:
     def test_result_is_bike_instance(self) -> None:
         bike = create_bike({"bike_id": "BK008", "bike_type": "electric"})
         assert isinstance(bike, Bike)
+
+
+# ---------------------------------------------------------------------------
+# create_user
+# ---------------------------------------------------------------------------
+
+class TestCreateUser:
+
+    def test_creates_casual_user(self) -> None:
+        user = create_user({
+            "user_id": "U001",
+            "name": "Alice",
+            "email": "alice@example.com",
+            "user_type": "casual",
+        })
+        assert isinstance(user, CasualUser)
+        assert user.id == "U001"
+        assert user.user_type == "casual"
+
+    def test_creates_member_user(self) -> None:
+        user = create_user({
+            "user_id": "U002",
+            "name": "Bob",
+            "email": "bob@example.com",
+            "user_type": "member",
+            "tier": "premium",
+        })
+        assert isinstance(user, MemberUser)
+        assert user.tier == "premium"
+
+    def test_member_dates_parsed_from_iso(self) -> None:
+        user = create_user({
+            "user_id": "U003",
+            "name": "Charlie",
+            "email": "charlie@example.com",
+            "user_type": "member",
+            "membership_start": "2024-01-01 00:00:00",
+            "membership_end": "2024-12-31 00:00:00",
+        })
+        assert user.membership_start == datetime(2024, 1, 1)
+        assert user.membership_end == datetime(2024, 12, 31)
+
+    def test_case_insensitive_type(self) -> None:
+        user = create_user({
+            "user_id": "U004",
+            "name": "Dana",
+            "email": "dana@example.com",
+            "user_type": "Member",
+        })
+        assert isinstance(user, MemberUser)
+
+    def test_unknown_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown user_type"):
+            create_user({
+                "user_id": "U005",
+                "name": "Eve",
+                "email": "eve@example.com",
+                "user_type": "robot",
+            })
+
+    def test_result_is_user_instance(self) -> None:
+        user = create_user({
+            "user_id": "U006",
+            "name": "Frank",
+            "email": "frank@example.com",
+            "user_type": "casual",
+        })
+        assert isinstance(user, User)
+
+
+# ---------------------------------------------------------------------------
+# create_bikes_bulk
+# ---------------------------------------------------------------------------
+
+class TestCreateBikesBulk:
+
+    def test_creates_bikes_in_row_order(self) -> None:
+        rows = [
+            {"bike_id": "BK020", "bike_type": "classic"},
+            {"bike_id": "BK021", "bike_type": "electric"},
+        ]
+        bikes = create_bikes_bulk(rows)
+        assert [b.id for b in bikes] == ["BK020", "BK021"]
+        assert isinstance(bikes[0], ClassicBike)
+        assert isinstance(bikes[1], ElectricBike)
+
+    def test_batch_shares_one_timestamp(self) -> None:
+        rows = [
+            {"bike_id": "BK022", "bike_type": "classic"},
+            {"bike_id": "BK023", "bike_type": "classic"},
+        ]
+        bikes = create_bikes_bulk(rows)
+        assert bikes[0].created_at == bikes[1].created_at
+
+    def test_unknown_type_raises(self) -> None:
+        rows = [{"bike_id": "BK024", "bike_type": "scooter"}]
+        with pytest.raises(ValueError, match="Unknown bike_type"):
+            create_bikes_bulk(rows)
+
+
+# ---------------------------------------------------------------------------
+# make_bike_builder
+# ---------------------------------------------------------------------------
+
+class TestMakeBikeBuilder:
+
+    def test_reads_present_columns(self) -> None:
+        build = make_bike_builder(
+            frozenset({"bike_id", "bike_type", "gear_count"})
+        )
+        bike = build({"bike_id": "BK030", "bike_type": "classic",
+                      "gear_count": "21"})
+        assert bike.gear_count == 21
+
+    def test_inlines_defaults_for_absent_columns(self) -> None:
+        build = make_bike_builder(frozenset({"bike_id", "bike_type"}))
+        bike = build({"bike_id": "BK031", "bike_type": "electric"})
+        assert bike.battery_level == 100.0
+        assert bike.max_range_km == 50.0
+
+    def test_builder_cached_per_column_set(self) -> None:
+        columns = frozenset({"bike_id", "bike_type"})
+        assert make_bike_builder(columns) is make_bike_builder(columns)
+
+    def test_unknown_type_raises(self) -> None:
+        build = make_bike_builder(frozenset({"bike_id", "bike_type"}))
+        with pytest.raises(ValueError, match="Unknown bike_type"):
+            build({"bike_id": "BK032", "bike_type": "scooter"})
+
+
+# ---------------------------------------------------------------------------
+# create_users_bulk
+# ---------------------------------------------------------------------------
+
+class TestCreateUsersBulk:
+
+    def test_creates_users_in_row_order(self) -> None:
+        rows = [
+            {
+                "user_id": "U010",
+                "name": "Alice",
+                "email": "alice@example.com",
+                "user_type": "casual",
+            },
+            {
+                "user_id": "U011",
+                "name": "Bob",
+                "email": "bob@example.com",
+                "user_type": "member",
+            },
+        ]
+        users = create_users_bulk(rows)
+        assert len(users) == 2
+        assert isinstance(users[0], CasualUser)
+        assert isinstance(users[1], MemberUser)
+        assert [u.id for u in users] == ["U010", "U011"]
+
+    def test_parses_iso_dates_with_utc_suffix(self) -> None:
+        rows = [{
+            "user_id": "U012",
+            "name": "Charlie",
+            "email": "charlie@example.com",
+            "user_type": "member",
+            "membership_start": "2024-01-01T00:00:00Z",
+        }]
+        (user,) = create_users_bulk(rows)
+        assert user.membership_start.year == 2024
+        assert user.membership_start.tzinfo is not None
+
+    def test_unknown_type_raises(self) -> None:
+        rows = [{
+            "user_id": "U013",
+            "name": "Dana",
+            "email": "dana@example.com",
+            "user_type": "robot",
+        }]
+        with pytest.raises(ValueError, match="Unknown user_type"):
+            create_users_bulk(rows)
+
+
+# ---------------------------------------------------------------------------
+# create_users_from_dataframe
+# ---------------------------------------------------------------------------
+
+class TestCreateUsersFromDataframe:
+
+    def test_creates_users_with_parsed_dates(self) -> None:
+        df = pd.DataFrame({
+            "user_id": ["U020", "U021"],
+            "name": ["Alice", "Bob"],
+            "email": ["alice@example.com", "bob@example.com"],
+            "user_type": ["casual", "member"],
+            "membership_start": [None, "2024-01-01 00:00:00"],
+            "membership_end": [None, "2024-12-31 00:00:00"],
+        })
+        users = create_users_from_dataframe(df)
+        assert isinstance(users[0], CasualUser)
+        assert isinstance(users[1], MemberUser)
+        assert users[1].membership_start == datetime(2024, 1, 1)
+        assert users[1].membership_end == datetime(2024, 12, 31)
+
+    def test_missing_optional_columns(self) -> None:
+        df = pd.DataFrame({
+            "user_id": ["U022"],
+            "name": ["Charlie"],
+            "email": ["charlie@example.com"],
+            "user_type": ["member"],
+        })
+        (user,) = create_users_from_dataframe(df)
+        assert user.tier == "basic"
+        assert user.membership_start is None
+
+    def test_unknown_type_raises(self) -> None:
+        df = pd.DataFrame({
+            "user_id": ["U023"],
+            "name": ["Dana"],
+            "email": ["dana@example.com"],
+            "user_type": ["robot"],
+        })
+        with pytest.raises(ValueError, match="Unknown user_type"):
+            create_users_from_dataframe(df)
+
+    def test_mixed_frame_nan_optionals_get_defaults(self) -> None:
+        # Casual rows leave tier NaN and member rows leave
+        # day_pass_count NaN; both fall back to the row-wise defaults
+        df = pd.DataFrame({
+            "user_id": ["U025", "U026"],
+            "name": ["Frank", "Grace"],
+            "email": ["frank@example.com", "grace@example.com"],
+            "user_type": ["casual", "member"],
+            "day_pass_count": [2, None],
+            "tier": [None, None],
+        })
+        casual, member = create_users_from_dataframe(df)
+        assert casual.day_pass_count == 2
+        assert member.tier == "basic"
+
+    def test_malformed_date_raises(self) -> None:
+        # Matches the row-wise paths: bad dates fail the whole ingest
+        # instead of silently becoming open-ended memberships
+        df = pd.DataFrame({
+            "user_id": ["U024"],
+            "name": ["Eve"],
+            "email": ["eve@example.com"],
+            "user_type": ["member"],
+            "membership_start": ["not-a-date"],
+        })
+        with pytest.raises(ValueError):
+            create_users_from_dataframe(df)
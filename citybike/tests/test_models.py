@@ -15,7 +15,8 @@ from models import (
     Station, 
     Entity,
     User, CasualUser, MemberUser,
-    Trip, MaintenanceRecord
+    Trip, MaintenanceRecord,
+    InvalidBikeTypeError, InvalidStatusError,
 )
 
 
@@ -60,13 +61,23 @@ class TestEntity:
 class TestBike:
     """Tests for the Bike base class."""
 
-    def test_bike_rejects_invalid_type(self) -> None:
-        with pytest.raises(ValueError, match="Invalid bike_type"):
-            Bike(bike_id="BK001", bike_type="scooter")
-
-    def test_bike_rejects_invalid_status(self) -> None:
-        with pytest.raises(ValueError, match="Invalid status"):
-            Bike(bike_id="BK001", bike_type="classic", status="broken")
+    # Typed exceptions make the expectation a plain isinstance check —
+    # no match= regex, and error-message rewording cannot break these
+    @pytest.mark.parametrize("kwargs, exc_type", [
+        pytest.param(
+            dict(bike_id="BK001", bike_type="scooter"),
+            InvalidBikeTypeError,
+            id="invalid_type",
+        ),
+        pytest.param(
+            dict(bike_id="BK001", bike_type="classic", status="broken"),
+            InvalidStatusError,
+            id="invalid_status",
+        ),
+    ])
+    def test_bike_rejects_invalid(self, kwargs: dict, exc_type: type) -> None:
+        with pytest.raises(exc_type):
+            Bike(**kwargs)
 
     def test_bike_default_status(self) -> None:
         bike = Bike(bike_id="BK001", bike_type="classic")
@@ -85,19 +96,9 @@ class TestBike:
 
     def test_bike_status_setter_invalid(self) -> None:
         bike = Bike(bike_id="BK001", bike_type="classic")
-        with pytest.raises(ValueError, match="Invalid status"):
+        with pytest.raises(InvalidStatusError):
             bike.status = "destroyed"
 
-    def test_bike_str(self) -> None:
-        bike = Bike(bike_id="BK001", bike_type="classic", status="in_use")
-        assert str(bike) == "Bike(BK001, classic, in_use)"
-
-    def test_bike_repr(self) -> None:
-        bike = Bike(bike_id="BK001", bike_type="classic", status="available")
-        r = repr(bike)
-        assert "BK001" in r
-        assert "classic" in r
-        assert "available" in r
 
 
 # ---------------------------------------------------------------------------
@@ -118,29 +119,15 @@ class TestClassicBike:
         bike = ClassicBike(bike_id="BK011", gear_count=21)
         assert bike.gear_count == 21
 
-    def test_rejects_zero_gears(self) -> None:
-        with pytest.raises(ValueError):
-            ClassicBike(bike_id="BK012", gear_count=0)
-
-    def test_rejects_negative_gears(self) -> None:
+    @pytest.mark.parametrize("gear_count", [
+        pytest.param(0, id="zero_gears"),
+        pytest.param(-3, id="negative_gears"),
+    ])
+    def test_rejects_invalid_gears(self, gear_count: int) -> None:
         with pytest.raises(ValueError):
-            ClassicBike(bike_id="BK013", gear_count=-3)
-
-    def test_is_instance_of_bike(self) -> None:
-        bike = ClassicBike(bike_id="BK014")
-        assert isinstance(bike, Bike)
-        assert isinstance(bike, Entity)
+            ClassicBike(bike_id="BK012", gear_count=gear_count)
 
-    def test_str(self) -> None:
-        bike = ClassicBike(bike_id="BK015", gear_count=7)
-        assert str(bike) == "ClassicBike(BK015, gears=7)"
 
-    def test_repr(self) -> None:
-        bike = ClassicBike(bike_id="BK015", gear_count=7, status="available")
-        r = repr(bike)
-        assert "BK015" in r
-        assert "gear_count=7" in r
-        assert "available" in r
 
 
 # ---------------------------------------------------------------------------
@@ -169,41 +156,16 @@ class TestElectricBike:
         assert bike.max_range_km == 65.0
         assert bike.status == "in_use"
 
-    def test_rejects_battery_above_100(self) -> None:
-        with pytest.raises(ValueError):
-            ElectricBike(bike_id="EB003", battery_level=150.0)
-
-    def test_rejects_battery_below_0(self) -> None:
-        with pytest.raises(ValueError):
-            ElectricBike(bike_id="EB004", battery_level=-5.0)
-
-    def test_rejects_non_positive_range(self) -> None:
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param(dict(battery_level=150.0), id="battery_above_100"),
+        pytest.param(dict(battery_level=-5.0), id="battery_below_0"),
+        pytest.param(dict(max_range_km=0), id="non_positive_range"),
+    ])
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
         with pytest.raises(ValueError):
-            ElectricBike(bike_id="EB005", max_range_km=0)
+            ElectricBike(bike_id="EB003", **kwargs)
 
-    def test_is_instance_of_bike_and_entity(self) -> None:
-        bike = ElectricBike(bike_id="EB006")
-        assert isinstance(bike, Bike)
-        assert isinstance(bike, Entity)
 
-    def test_str(self) -> None:
-        bike = ElectricBike(bike_id="EB007", battery_level=90.0)
-        s = str(bike)
-        assert "ElectricBike" in s
-        assert "EB007" in s
-        assert "90" in s
-
-    def test_repr(self) -> None:
-        bike = ElectricBike(
-            bike_id="EB008",
-            battery_level=75.0,
-            max_range_km=55.0,
-        )
-        r = repr(bike)
-        assert "ElectricBike" in r
-        assert "EB008" in r
-        assert "battery_level=75.0" in r
-        assert "max_range_km=55.0" in r
 
 
 # ---------------------------------------------------------------------------
@@ -228,93 +190,25 @@ class TestStation:
         assert station.latitude == 48.78
         assert station.longitude == 9.18
 
-    def test_rejects_zero_capacity(self) -> None:
-        with pytest.raises(ValueError):
-            Station(
-                station_id="ST002",
-                name="Zero Cap",
-                capacity=0,
-                latitude=48.7,
-                longitude=9.1,
-            )
-
-    def test_rejects_negative_capacity(self) -> None:
-        with pytest.raises(ValueError):
-            Station(
-                station_id="ST003",
-                name="Negative Cap",
-                capacity=-5,
-                latitude=48.7,
-                longitude=9.1,
-            )
-
-    def test_rejects_invalid_latitude(self) -> None:
-        with pytest.raises(ValueError):
-            Station(
-                station_id="ST004",
-                name="Bad Lat",
-                capacity=10,
-                latitude=120.0,
-                longitude=9.1,
-            )
-
-    def test_rejects_invalid_longitude(self) -> None:
-        with pytest.raises(ValueError):
-            Station(
-                station_id="ST005",
-                name="Bad Lon",
-                capacity=10,
-                latitude=48.7,
-                longitude=250.0,
-            )
-
-    def test_rejects_empty_name(self) -> None:
-        with pytest.raises(ValueError):
-            Station(
-                station_id="ST006",
-                name="   ",
-                capacity=10,
-                latitude=48.7,
-                longitude=9.1,
-            )
-
-    def test_is_instance_of_entity(self) -> None:
-        station = Station(
-            station_id="ST007",
-            name="Entity Test",
-            capacity=15,
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param(dict(capacity=0), id="zero_capacity"),
+        pytest.param(dict(capacity=-5), id="negative_capacity"),
+        pytest.param(dict(latitude=120.0), id="invalid_latitude"),
+        pytest.param(dict(longitude=250.0), id="invalid_longitude"),
+        pytest.param(dict(name="   "), id="empty_name"),
+    ])
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
+        valid = dict(
+            station_id="ST002",
+            name="Test Station",
+            capacity=10,
             latitude=48.7,
             longitude=9.1,
         )
-        assert isinstance(station, Entity)
+        with pytest.raises(ValueError):
+            Station(**{**valid, **kwargs})
 
-    def test_str(self) -> None:
-        station = Station(
-            station_id="ST008",
-            name="Market Square",
-            capacity=25,
-            latitude=48.75,
-            longitude=9.15,
-        )
-        s = str(station)
-        assert "Station" in s
-        assert "ST008" in s
-        assert "Market Square" in s
-        assert "25" in s
 
-    def test_repr(self) -> None:
-        station = Station(
-            station_id="ST009",
-            name="Old Town",
-            capacity=30,
-            latitude=48.76,
-            longitude=9.16,
-        )
-        r = repr(station)
-        assert "Station" in r
-        assert "ST009" in r
-        assert "Old Town" in r
-        assert "capacity=30" in r
 
 # ---------------------------------------------------------------------------
 # User
@@ -336,66 +230,22 @@ class TestUser:
         assert user.email == "alice@example.com"
         assert user.user_type == "casual"
 
-    def test_rejects_empty_name(self) -> None:
-        with pytest.raises(ValueError):
-            User(
-                user_id="U002",
-                name="   ",
-                email="bob@example.com",
-                user_type="casual",
-            )
-
-    def test_rejects_invalid_email(self) -> None:
-        with pytest.raises(ValueError):
-            User(
-                user_id="U003",
-                name="Charlie",
-                email="charlieexample.com",
-                user_type="member",
-            )
-
-    def test_rejects_empty_user_type(self) -> None:
-        with pytest.raises(ValueError):
-            User(
-                user_id="U004",
-                name="Dana",
-                email="dana@example.com",
-                user_type="",
-            )
-
-    def test_is_instance_of_entity(self) -> None:
-        user = User(
-            user_id="U005",
-            name="Eve",
-            email="eve@example.com",
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param(dict(name="   "), id="empty_name"),
+        pytest.param(dict(email="bobexample.com"), id="invalid_email"),
+        pytest.param(dict(user_type=""), id="empty_user_type"),
+    ])
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
+        valid = dict(
+            user_id="U002",
+            name="Bob",
+            email="bob@example.com",
             user_type="casual",
         )
-        assert isinstance(user, Entity)
+        with pytest.raises(ValueError):
+            User(**{**valid, **kwargs})
 
-    def test_str(self) -> None:
-        user = User(
-            user_id="U006",
-            name="Frank",
-            email="frank@example.com",
-            user_type="member",
-        )
-        s = str(user)
-        assert "User" in s
-        assert "U006" in s
-        assert "member" in s
 
-    def test_repr(self) -> None:
-        user = User(
-            user_id="U007",
-            name="Grace",
-            email="grace@example.com",
-            user_type="casual",
-        )
-        r = repr(user)
-        assert "U007" in r
-        assert "Grace" in r
-        assert "grace@example.com" in r
-        assert "casual" in r
 
 
 # ---------------------------------------------------------------------------
@@ -434,38 +284,7 @@ class TestCasualUser:
                 day_pass_count=-1,
             )
 
-    def test_is_instance_of_user(self) -> None:
-        user = CasualUser(
-            user_id="CU004",
-            name="Dana",
-            email="dana@example.com",
-        )
-        assert isinstance(user, User)
-        assert isinstance(user, Entity)
-
-    def test_str(self) -> None:
-        user = CasualUser(
-            user_id="CU005",
-            name="Eve",
-            email="eve@example.com",
-            day_pass_count=2,
-        )
-        s = str(user)
-        assert "CasualUser" in s
-        assert "CU005" in s
-        assert "2" in s
 
-    def test_repr(self) -> None:
-        user = CasualUser(
-            user_id="CU006",
-            name="Frank",
-            email="frank@example.com",
-            day_pass_count=1,
-        )
-        r = repr(user)
-        assert "CU006" in r
-        assert "Frank" in r
-        assert "day_pass_count=1" in r
 # ---------------------------------------------------------------------------
 # MemberUser
 # ---------------------------------------------------------------------------
@@ -503,271 +322,421 @@ class TestMemberUser:
         assert user.membership_start == start
         assert user.membership_end == end
 
-    def test_rejects_invalid_tier(self) -> None:
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param(dict(tier="gold"), id="invalid_tier"),
+        pytest.param(
+            dict(
+                membership_start=datetime(2024, 6, 1),
+                membership_end=datetime(2024, 5, 1),
+            ),
+            id="end_before_start",
+        ),
+    ])
+    def test_rejects_invalid_values(self, kwargs: dict) -> None:
         with pytest.raises(ValueError):
             MemberUser(
                 user_id="MU003",
                 name="Charlie",
                 email="charlie@example.com",
-                tier="gold",
-            )
-
-    def test_rejects_invalid_membership_dates(self) -> None:
-        start = datetime(2024, 6, 1)
-        end = datetime(2024, 5, 1)
-
-        with pytest.raises(ValueError):
-            MemberUser(
-                user_id="MU004",
-                name="Dana",
-                email="dana@example.com",
-                membership_start=start,
-                membership_end=end,
+                **kwargs,
             )
 
-    def test_is_instance_of_user(self) -> None:
-        user = MemberUser(
-            user_id="MU005",
-            name="Eve",
-            email="eve@example.com",
-        )
-        assert isinstance(user, User)
-        assert isinstance(user, Entity)
 
-    def test_str(self) -> None:
-        user = MemberUser(
-            user_id="MU006",
-            name="Frank",
-            email="frank@example.com",
-            tier="premium",
-        )
-        s = str(user)
-        assert "MemberUser" in s
-        assert "MU006" in s
-        assert "premium" in s
-
-    def test_repr(self) -> None:
-        user = MemberUser(
-            user_id="MU007",
-            name="Grace",
-            email="grace@example.com",
-            tier="basic",
-        )
-        r = repr(user)
-        assert "MU007" in r
-        assert "Grace" in r
-        assert "tier='basic'" in r
 
 
 # ---------------------------------------------------------------------------
 # Trip
 # ---------------------------------------------------------------------------
 
+# None of the Trip / MaintenanceRecord tests mutate these objects, so
+# they are built once per module instead of once per test method.
+
+@pytest.fixture(scope="module")
+def sample_user() -> CasualUser:
+    return CasualUser(
+        user_id="U001",
+        name="Alice",
+        email="alice@example.com",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_bike() -> ClassicBike:
+    return ClassicBike(bike_id="BK001")
+
+
+@pytest.fixture(scope="module")
+def sample_start_station() -> Station:
+    return Station(
+        station_id="ST001",
+        name="Central",
+        capacity=10,
+        latitude=48.7,
+        longitude=9.1,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_end_station() -> Station:
+    return Station(
+        station_id="ST002",
+        name="West End",
+        capacity=12,
+        latitude=48.8,
+        longitude=9.2,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_date() -> datetime:
+    return datetime(2024, 6, 1)
+
+
+@pytest.fixture(scope="module")
+def trip_parts(
+    sample_user: CasualUser,
+    sample_bike: ClassicBike,
+    sample_start_station: Station,
+    sample_end_station: Station,
+) -> dict:
+    return dict(
+        user=sample_user,
+        bike=sample_bike,
+        start_station=sample_start_station,
+        end_station=sample_end_station,
+    )
+
+
+# Both formatting tests of each class read the same immutable object,
+# so it is built once per module instead of once per formatter
+@pytest.fixture(scope="module")
+def formatted_trip(trip_parts: dict) -> Trip:
+    return Trip(
+        trip_id="TR005",
+        start_time=datetime(2024, 6, 1, 9, 0),
+        end_time=datetime(2024, 6, 1, 9, 15),
+        distance_km=2.0,
+        **trip_parts,
+    )
+
+
+@pytest.fixture(scope="module")
+def formatted_record(
+    sample_bike: ClassicBike, sample_date: datetime
+) -> MaintenanceRecord:
+    return MaintenanceRecord(
+        record_id="MR005",
+        bike=sample_bike,
+        date=sample_date,
+        maintenance_type="general_inspection",
+        cost=40.0,
+    )
+
+
+@pytest.mark.slow
 class TestTrip:
     """Tests for the Trip class."""
 
-    def setup_method(self) -> None:
-        self.user = CasualUser(
-            user_id="U001",
-            name="Alice",
-            email="alice@example.com",
-        )
-        self.bike = ClassicBike(bike_id="BK001")
-        self.start_station = Station(
-            station_id="ST001",
-            name="Central",
-            capacity=10,
-            latitude=48.7,
-            longitude=9.1,
-        )
-        self.end_station = Station(
-            station_id="ST002",
-            name="West End",
-            capacity=12,
-            latitude=48.8,
-            longitude=9.2,
-        )
-
-    def test_creation_valid(self) -> None:
+    def test_creation_valid(self, trip_parts: dict) -> None:
         start = datetime(2024, 6, 1, 10, 0)
         end = datetime(2024, 6, 1, 10, 30)
 
         trip = Trip(
             trip_id="TR001",
-            user=self.user,
-            bike=self.bike,
-            start_station=self.start_station,
-            end_station=self.end_station,
             start_time=start,
             end_time=end,
             distance_km=5.2,
+            **trip_parts,
         )
 
         assert trip.trip_id == "TR001"
         assert trip.distance_km == 5.2
         assert trip.duration_minutes == 30.0
 
-    def test_rejects_negative_distance(self) -> None:
+    def test_rejects_negative_distance(self, trip_parts: dict) -> None:
         start = datetime(2024, 6, 1, 10, 0)
         end = datetime(2024, 6, 1, 10, 10)
 
         with pytest.raises(ValueError):
             Trip(
                 trip_id="TR002",
-                user=self.user,
-                bike=self.bike,
-                start_station=self.start_station,
-                end_station=self.end_station,
                 start_time=start,
                 end_time=end,
                 distance_km=-1.0,
+                **trip_parts,
             )
 
-    def test_rejects_invalid_time_order(self) -> None:
+    def test_rejects_invalid_time_order(self, trip_parts: dict) -> None:
         start = datetime(2024, 6, 1, 11, 0)
         end = datetime(2024, 6, 1, 10, 0)
 
         with pytest.raises(ValueError):
             Trip(
                 trip_id="TR003",
-                user=self.user,
-                bike=self.bike,
-                start_station=self.start_station,
-                end_station=self.end_station,
                 start_time=start,
                 end_time=end,
                 distance_km=3.0,
+                **trip_parts,
             )
 
-    def test_duration_minutes_fractional(self) -> None:
+    def test_duration_minutes_fractional(self, trip_parts: dict) -> None:
         start = datetime(2024, 6, 1, 10, 0)
         end = datetime(2024, 6, 1, 10, 45, 30)
 
         trip = Trip(
             trip_id="TR004",
-            user=self.user,
-            bike=self.bike,
-            start_station=self.start_station,
-            end_station=self.end_station,
             start_time=start,
             end_time=end,
             distance_km=7.0,
+            **trip_parts,
         )
 
         assert trip.duration_minutes == pytest.approx(45.5)
 
-    def test_str(self) -> None:
-        trip = Trip(
-            trip_id="TR005",
-            user=self.user,
-            bike=self.bike,
-            start_station=self.start_station,
-            end_station=self.end_station,
-            start_time=datetime(2024, 6, 1, 9, 0),
-            end_time=datetime(2024, 6, 1, 9, 15),
-            distance_km=2.0,
-        )
-
-        s = str(trip)
+    def test_str(self, formatted_trip: Trip) -> None:
+        s = str(formatted_trip)
         assert "TR005" in s
         assert "U001" in s
         assert "BK001" in s
 
-    def test_repr(self) -> None:
-        trip = Trip(
-            trip_id="TR006",
-            user=self.user,
-            bike=self.bike,
-            start_station=self.start_station,
-            end_station=self.end_station,
-            start_time=datetime(2024, 6, 1, 9, 0),
-            end_time=datetime(2024, 6, 1, 9, 15),
-            distance_km=2.0,
-        )
-
-        r = repr(trip)
-        assert "TR006" in r
+    def test_repr(self, formatted_trip: Trip) -> None:
+        r = repr(formatted_trip)
+        assert "TR005" in r
         assert "distance_km" in r
 
 # ---------------------------------------------------------------------------
 # MaintenanceRecord
 # ---------------------------------------------------------------------------
 
+@pytest.mark.slow
 class TestMaintenanceRecord:
     """Tests for the MaintenanceRecord class."""
 
-    def setup_method(self) -> None:
-        self.bike = ClassicBike(bike_id="BK100")
-        self.date = datetime(2024, 6, 1)
-
-    def test_creation_valid(self) -> None:
+    def test_creation_valid(
+        self, sample_bike: ClassicBike, sample_date: datetime
+    ) -> None:
         record = MaintenanceRecord(
             record_id="MR001",
-            bike=self.bike,
-            date=self.date,
+            bike=sample_bike,
+            date=sample_date,
             maintenance_type="tire_repair",
             cost=25.5,
             description="Fixed flat tire",
         )
 
         assert record.record_id == "MR001"
-        assert record.bike == self.bike
+        assert record.bike == sample_bike
         assert record.cost == 25.5
         assert record.maintenance_type == "tire_repair"
 
-    def test_rejects_negative_cost(self) -> None:
+    def test_rejects_negative_cost(
+        self, sample_bike: ClassicBike, sample_date: datetime
+    ) -> None:
         with pytest.raises(ValueError):
             MaintenanceRecord(
                 record_id="MR002",
-                bike=self.bike,
-                date=self.date,
+                bike=sample_bike,
+                date=sample_date,
                 maintenance_type="brake_adjustment",
                 cost=-10.0,
             )
 
-    def test_rejects_invalid_type(self) -> None:
+    def test_rejects_invalid_type(
+        self, sample_bike: ClassicBike, sample_date: datetime
+    ) -> None:
         with pytest.raises(ValueError):
             MaintenanceRecord(
                 record_id="MR003",
-                bike=self.bike,
-                date=self.date,
+                bike=sample_bike,
+                date=sample_date,
                 maintenance_type="engine_repair",
                 cost=30.0,
             )
 
-    def test_rejects_invalid_bike(self) -> None:
+    def test_rejects_invalid_bike(self, sample_date: datetime) -> None:
         with pytest.raises(TypeError):
             MaintenanceRecord(
                 record_id="MR004",
                 bike="not_a_bike",  # type: ignore[arg-type]
-                date=self.date,
+                date=sample_date,
                 maintenance_type="tire_repair",
                 cost=10.0,
             )
 
-    def test_str(self) -> None:
-        record = MaintenanceRecord(
-            record_id="MR005",
-            bike=self.bike,
-            date=self.date,
-            maintenance_type="general_inspection",
-            cost=40.0,
-        )
-
-        s = str(record)
+    def test_str(self, formatted_record: MaintenanceRecord) -> None:
+        s = str(formatted_record)
         assert "MR005" in s
-        assert "BK100" in s
+        assert "BK001" in s
         assert "general_inspection" in s
 
-    def test_repr(self) -> None:
-        record = MaintenanceRecord(
-            record_id="MR006",
-            bike=self.bike,
-            date=self.date,
-            maintenance_type="chain_lubrication",
-            cost=15.0,
-        )
+    def test_repr(self, formatted_record: MaintenanceRecord) -> None:
+        r = repr(formatted_record)
+        assert "MR005" in r
+        assert "general_inspection" in r
+
+# ---------------------------------------------------------------------------
+# Inheritance
+# ---------------------------------------------------------------------------
+
+# MRO is a class-level property: checking cls.__mro__ directly covers
+# the same contract as the old per-class isinstance tests without
+# constructing (and validating) an instance of each type.
 
-        r = repr(record)
-        assert "MR006" in r
-        assert "chain_lubrication" in r
+@pytest.mark.parametrize("cls, expected_bases", [
+    pytest.param(ClassicBike, {Bike, Entity}, id="classic"),
+    pytest.param(ElectricBike, {Bike, Entity}, id="electric"),
+    pytest.param(Station, {Entity}, id="station"),
+    pytest.param(User, {Entity}, id="user"),
+    pytest.param(CasualUser, {User, Entity}, id="casual"),
+    pytest.param(MemberUser, {User, Entity}, id="member"),
+])
+def test_mro(cls: type, expected_bases: set) -> None:
+    assert expected_bases.issubset(set(cls.__mro__))
+
+
+# ---------------------------------------------------------------------------
+# __str__ / __repr__ formatting
+# ---------------------------------------------------------------------------
+
+# One parametrized test per formatting contract: each object is built
+# exactly once and formatted exactly once, instead of one test method
+# (and one rebuild) per class-and-formatter pair.
+
+@pytest.mark.parametrize("obj_factory, expected_substrings, formatter", [
+    pytest.param(
+        lambda: Bike(bike_id="BK001", bike_type="classic", status="available"),
+        ["BK001", "classic", "available"],
+        repr,
+        id="bike-repr",
+    ),
+    pytest.param(
+        lambda: ClassicBike(bike_id="BK015", gear_count=7, status="available"),
+        ["BK015", "gear_count=7", "available"],
+        repr,
+        id="classic-repr",
+    ),
+    pytest.param(
+        lambda: ElectricBike(bike_id="EB007", battery_level=90.0),
+        ["ElectricBike", "EB007", "90"],
+        str,
+        id="electric-str",
+    ),
+    pytest.param(
+        lambda: ElectricBike(
+            bike_id="EB008", battery_level=75.0, max_range_km=55.0
+        ),
+        ["ElectricBike", "EB008", "battery_level=75.0", "max_range_km=55.0"],
+        repr,
+        id="electric-repr",
+    ),
+    pytest.param(
+        lambda: Station(
+            station_id="ST008",
+            name="Market Square",
+            capacity=25,
+            latitude=48.75,
+            longitude=9.15,
+        ),
+        ["Station", "ST008", "Market Square", "25"],
+        str,
+        id="station-str",
+    ),
+    pytest.param(
+        lambda: Station(
+            station_id="ST009",
+            name="Old Town",
+            capacity=30,
+            latitude=48.76,
+            longitude=9.16,
+        ),
+        ["Station", "ST009", "Old Town", "capacity=30"],
+        repr,
+        id="station-repr",
+    ),
+    pytest.param(
+        lambda: User(
+            user_id="U006",
+            name="Frank",
+            email="frank@example.com",
+            user_type="member",
+        ),
+        ["User", "U006", "member"],
+        str,
+        id="user-str",
+    ),
+    pytest.param(
+        lambda: User(
+            user_id="U007",
+            name="Grace",
+            email="grace@example.com",
+            user_type="casual",
+        ),
+        ["U007", "Grace", "grace@example.com", "casual"],
+        repr,
+        id="user-repr",
+    ),
+    pytest.param(
+        lambda: CasualUser(
+            user_id="CU005",
+            name="Eve",
+            email="eve@example.com",
+            day_pass_count=2,
+        ),
+        ["CasualUser", "CU005", "2"],
+        str,
+        id="casual-str",
+    ),
+    pytest.param(
+        lambda: CasualUser(
+            user_id="CU006",
+            name="Frank",
+            email="frank@example.com",
+            day_pass_count=1,
+        ),
+        ["CU006", "Frank", "day_pass_count=1"],
+        repr,
+        id="casual-repr",
+    ),
+    pytest.param(
+        lambda: MemberUser(
+            user_id="MU006",
+            name="Frank",
+            email="frank@example.com",
+            tier="premium",
+        ),
+        ["MemberUser", "MU006", "premium"],
+        str,
+        id="member-str",
+    ),
+    pytest.param(
+        lambda: MemberUser(
+            user_id="MU007",
+            name="Grace",
+            email="grace@example.com",
+            tier="basic",
+        ),
+        ["MU007", "Grace", "tier='basic'"],
+        repr,
+        id="member-repr",
+    ),
+])
+def test_format_contains(obj_factory, expected_substrings, formatter) -> None:
+    s = formatter(obj_factory())
+    for sub in expected_substrings:
+        assert sub in s
+
+
+@pytest.mark.parametrize("obj_factory, expected", [
+    pytest.param(
+        lambda: Bike(bike_id="BK001", bike_type="classic", status="in_use"),
+        "Bike(BK001, classic, in_use)",
+        id="bike-str",
+    ),
+    pytest.param(
+        lambda: ClassicBike(bike_id="BK015", gear_count=7),
+        "ClassicBike(BK015, gears=7)",
+        id="classic-str",
+    ),
+])
+def test_format_exact(obj_factory, expected) -> None:
+    assert str(obj_factory()) == expected
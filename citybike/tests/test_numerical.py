@@ -16,50 +16,64 @@ from numerical import (
     calculate_fares,
     detect_outliers_zscore,
     station_distance_matrix,
+    station_knn,
+    stations_within_radius,
 )
 
 
+# Canonical inputs shared across tests, built once at import instead of
+# re-allocated inside every method. None of the routines under test
+# mutate their inputs.
+_DUR_5 = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+_DUR_SINGLE = np.array([42.0])
+_STABLE = np.array([10.0, 12.0, 11.0, 13.0, 12.5])
+
+# Reference std computed once at import and frozen as a plain float
+_STD_DUR_5 = float(np.std(_DUR_5))
+
+
 # ---------------------------------------------------------------------------
 # trip_duration_stats
 # ---------------------------------------------------------------------------
 
-class TestTripDurationStats:
+# trip_duration_stats is pure and TripStats is immutable, so compute
+# the canonical result once per module rather than once per assertion
+@pytest.fixture(scope="module")
+def stats_dur5():
+    return trip_duration_stats(_DUR_5)
 
-    def test_basic_stats(self) -> None:
-        durations = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
-        stats = trip_duration_stats(durations)
-        assert stats["mean"] == pytest.approx(30.0)
-        assert stats["median"] == pytest.approx(30.0)
 
-    def test_std(self) -> None:
-        durations = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
-        stats = trip_duration_stats(durations)
-        assert stats["std"] == pytest.approx(np.std(durations))
+class TestTripDurationStats:
 
-    def test_single_value(self) -> None:
-        durations = np.array([42.0])
-        stats = trip_duration_stats(durations)
-        assert stats["mean"] == pytest.approx(42.0)
-        assert stats["median"] == pytest.approx(42.0)
-        assert stats["std"] == pytest.approx(0.0)
+    @pytest.mark.parametrize("field, expected", [
+        ("mean", 30.0),
+        ("median", 30.0),
+        ("std", _STD_DUR_5),
+        ("p25", 20.0),
+        ("p75", 40.0),
+        ("p90", 46.0),
+    ])
+    def test_stats_fields(self, stats_dur5, field: str,
+                          expected: float) -> None:
+        assert getattr(stats_dur5, field) == pytest.approx(expected)
 
-    def test_percentiles(self) -> None:
-        durations = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
-        stats = trip_duration_stats(durations)
-        assert stats["p25"] == pytest.approx(20.0)
-        assert stats["p75"] == pytest.approx(40.0)
-        assert stats["p90"] == pytest.approx(46.0)  # 90th percentile
+    def test_single_value(self) -> None:
+        stats = trip_duration_stats(_DUR_SINGLE)
+        assert stats.mean == pytest.approx(42.0)
+        assert stats.median == pytest.approx(42.0)
+        assert stats.std == pytest.approx(0.0)
 
-    def test_returns_expected_keys(self) -> None:
+    def test_has_expected_fields(self) -> None:
         durations = np.array([1.0, 2.0, 3.0])
         stats = trip_duration_stats(durations)
-        for key in ["mean", "median", "std", "p25", "p75", "p90"]:
-            assert key in stats
+        assert stats._fields == ("mean", "median", "std", "p25", "p75", "p90")
 
-    def test_values_are_floats(self) -> None:
+    def test_asdict_round_trip(self) -> None:
         durations = np.array([5.0, 15.0, 25.0])
         stats = trip_duration_stats(durations)
-        for val in stats.values():
+        as_dict = stats._asdict()
+        assert as_dict["mean"] == stats.mean
+        for val in as_dict.values():
             assert isinstance(val, float)
 
 
@@ -69,101 +83,167 @@ class TestTripDurationStats:
 
 class TestCalculateFares:
 
-    def test_basic_fare_calculation(self) -> None:
-        durations = np.array([10, 20, 30])
-        distances = np.array([2.0, 5.0, 8.0])
-        fares = calculate_fares(durations, distances, per_minute=0.15, per_km=0.10, unlock_fee=1.0)
-        expected = np.array([2.7, 4.5, 6.3])
-        assert np.allclose(fares, expected)
-
-    def test_no_unlock_fee(self) -> None:
-        durations = np.array([10, 20])
-        distances = np.array([2.0, 5.0])
-        fares = calculate_fares(durations, distances, per_minute=0.1, per_km=0.05)
-        expected = np.array([1.1, 2.25])
-        assert np.allclose(fares, expected)
-
-    def test_zero_duration_and_distance(self) -> None:
-        durations = np.array([0, 0])
-        distances = np.array([0.0, 0.0])
-        fares = calculate_fares(durations, distances, per_minute=0.1, per_km=0.05, unlock_fee=1.0)
-        expected = np.array([1.0, 1.0])
-        assert np.allclose(fares, expected)
+    @pytest.mark.parametrize("durations, distances, kwargs, expected", [
+        pytest.param(
+            np.array([10, 20, 30]), np.array([2.0, 5.0, 8.0]),
+            dict(per_minute=0.15, per_km=0.10, unlock_fee=1.0),
+            [2.7, 4.5, 6.3],
+            id="basic",
+        ),
+        pytest.param(
+            np.array([10, 20]), np.array([2.0, 5.0]),
+            dict(per_minute=0.1, per_km=0.05),
+            [1.1, 2.25],
+            id="no_unlock_fee",
+        ),
+        pytest.param(
+            np.array([0, 0]), np.array([0.0, 0.0]),
+            dict(per_minute=0.1, per_km=0.05, unlock_fee=1.0),
+            [1.0, 1.0],
+            id="zero",
+        ),
+    ])
+    def test_fare_scenarios(
+        self,
+        durations: np.ndarray,
+        distances: np.ndarray,
+        kwargs: dict,
+        expected: list,
+    ) -> None:
+        fares = calculate_fares(durations, distances, **kwargs)
+        assert np.allclose(fares, np.array(expected))
+
+    def test_vectorized_batch(self) -> None:
+        # All scenarios concatenated into one call: exercises the bulk
+        # path the function is built for with a single boundary crossing
+        durations = np.concatenate([[10, 20, 30], [10, 20], [0, 0]])
+        distances = np.concatenate([[2.0, 5.0, 8.0], [2.0, 5.0], [0.0, 0.0]])
+        fares = calculate_fares(
+            durations, distances, per_minute=0.15, per_km=0.10, unlock_fee=1.0
+        )
+        expected = 1.0 + 0.15 * durations + 0.10 * distances
+        assert fares.shape == (7,)
+        assert np.allclose(fares[:3], expected[:3])
+        assert np.allclose(fares[3:5], expected[3:5])
+        assert np.allclose(fares[5:], [1.0, 1.0])
 
 
-# ---------------------------------------------------------------------------
-# detect_outliers_zscore
-# ---------------------------------------------------------------------------
-
-import pytest
-import numpy as np
-from numerical import detect_outliers_zscore
-
 # ---------------------------------------------------------------------------
 # detect_outliers_zscore
 # ---------------------------------------------------------------------------
 
 class TestDetectOutliersZscore:
 
-    def test_no_outliers_default_threshold(self) -> None:
-        values = np.array([10.0, 12.0, 11.0, 13.0, 12.5])
-        outliers = detect_outliers_zscore(values)
-        expected = np.array([False, False, False, False, False])
-        assert np.array_equal(outliers, expected)
-
-    def test_basic_outliers_lower_threshold(self) -> None:
-        values = np.array([10.0, 20.0, 30.0, 100.0, 50.0])
-        # Lower threshold to actually detect the 100 as an outlier
-        outliers = detect_outliers_zscore(values, threshold=1.5)
-        expected = np.array([False, False, False, True, False])
-        assert np.array_equal(outliers, expected)
-
-    def test_single_value(self) -> None:
-        values = np.array([42.0])
-        outliers = detect_outliers_zscore(values)
-        expected = np.array([False])  # no outliers
-        assert np.array_equal(outliers, expected)
-
-    def test_all_same_values(self) -> None:
-        values = np.array([7.0, 7.0, 7.0])
-        outliers = detect_outliers_zscore(values)
-        expected = np.array([False, False, False])  # std=0 → no outliers
-        assert np.array_equal(outliers, expected)
-
-    def test_negative_values_and_outliers(self) -> None:
-        values = np.array([-10.0, -20.0, -30.0, -100.0, -50.0])
-        outliers = detect_outliers_zscore(values, threshold=1.5)
-        expected = np.array([False, False, False, True, False])
-        assert np.array_equal(outliers, expected)
+    @pytest.mark.parametrize("values, threshold, expected", [
+        pytest.param(
+            _STABLE, 3.0, [False] * 5,
+            id="no_outliers_default_threshold",
+        ),
+        pytest.param(
+            np.array([10.0, 20.0, 30.0, 100.0, 50.0]), 1.5,
+            [False, False, False, True, False],
+            id="basic_outliers_lower_threshold",
+        ),
+        pytest.param(_DUR_SINGLE, 3.0, [False], id="single_value"),
+        pytest.param(np.array([]), 3.0, [], id="empty"),
+        pytest.param(
+            np.array([7.0, 7.0, 7.0]), 3.0, [False, False, False],
+            id="all_same_values",  # std=0 → no outliers
+        ),
+        pytest.param(
+            np.array([-10.0, -20.0, -30.0, -100.0, -50.0]), 1.5,
+            [False, False, False, True, False],
+            id="negative_values_and_outliers",
+        ),
+    ])
+    def test_outliers(
+        self, values: np.ndarray, threshold: float, expected: list
+    ) -> None:
+        outliers = detect_outliers_zscore(values, threshold=threshold)
+        assert np.array_equal(outliers, np.array(expected))
 
 
 # ---------------------------------------------------------------------------
 # station_distance_matrix
 # ---------------------------------------------------------------------------
 
+# Coordinate inputs allocated once for the whole session; the function
+# under test never mutates them
+@pytest.fixture(scope="session")
+def geo_inputs() -> dict:
+    return {
+        "basic": (np.array([0.0, 0.0]), np.array([0.0, 3.0])),
+        "3x3": (np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 2.0])),
+        "diag": (np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0])),
+        "empty": (np.array([]), np.array([])),
+    }
+
+
 class TestStationDistanceMatrix:
 
-    def test_basic_distance_matrix(self) -> None:
-        lats = np.array([0.0, 0.0])
-        lons = np.array([0.0, 3.0])
-        matrix = station_distance_matrix(lats, lons)
+    def test_basic_distance_matrix(self, geo_inputs: dict) -> None:
+        matrix = station_distance_matrix(*geo_inputs["basic"])
         expected = np.array([[0.0, 3.0], [3.0, 0.0]])
         assert np.allclose(matrix, expected)
 
-    def test_square_matrix_shape(self) -> None:
-        lats = np.array([0.0, 1.0, 2.0])
-        lons = np.array([0.0, 1.0, 2.0])
-        matrix = station_distance_matrix(lats, lons)
+    def test_square_matrix_shape(self, geo_inputs: dict) -> None:
+        matrix = station_distance_matrix(*geo_inputs["3x3"])
         assert matrix.shape == (3, 3)
 
-    def test_diagonal_is_zero(self) -> None:
-        lats = np.array([1.0, 2.0, 3.0])
-        lons = np.array([4.0, 5.0, 6.0])
-        matrix = station_distance_matrix(lats, lons)
+    def test_diagonal_is_zero(self, geo_inputs: dict) -> None:
+        matrix = station_distance_matrix(*geo_inputs["diag"])
         assert np.allclose(np.diag(matrix), 0.0)
 
-    def test_empty_input(self) -> None:
-        lats = np.array([])
-        lons = np.array([])
-        matrix = station_distance_matrix(lats, lons)
+    def test_empty_input(self, geo_inputs: dict) -> None:
+        matrix = station_distance_matrix(*geo_inputs["empty"])
         assert matrix.shape == (0, 0)
+
+
+# ---------------------------------------------------------------------------
+# station_knn / stations_within_radius
+# ---------------------------------------------------------------------------
+
+class TestStationKnn:
+
+    def test_nearest_neighbour_excludes_self(self) -> None:
+        lats = np.array([0.0, 0.0, 0.0])
+        lons = np.array([0.0, 1.0, 5.0])
+        distances, indices = station_knn(lats, lons, k=1)
+        assert indices[0, 0] == 1  # station 1 is closest to station 0
+        assert distances[0, 0] == pytest.approx(1.0)
+
+    def test_output_shapes(self) -> None:
+        lats = np.array([0.0, 1.0, 2.0, 3.0])
+        lons = np.array([0.0, 1.0, 2.0, 3.0])
+        distances, indices = station_knn(lats, lons, k=2)
+        assert distances.shape == (4, 2)
+        assert indices.shape == (4, 2)
+
+    def test_within_radius(self) -> None:
+        lats = np.array([0.0, 0.0, 0.0])
+        lons = np.array([0.0, 1.0, 10.0])
+        neighbours = stations_within_radius(lats, lons, radius=2.0)
+        assert sorted(neighbours[0]) == [0, 1]
+        assert neighbours[2] == [2]
+
+
+# ---------------------------------------------------------------------------
+# Kernel dispatch across array layouts
+# ---------------------------------------------------------------------------
+
+def test_non_contiguous_inputs() -> None:
+    # Strided slices and 2-D column views must dispatch to the same
+    # kernels as contiguous arrays; the compiled signatures are only
+    # exercised for real under CITYBIKE_TEST_MODE=full
+    table = np.column_stack([_DUR_5, _DUR_5])
+    column = table[:, 0]
+    assert not column.flags["C_CONTIGUOUS"]
+
+    stats = trip_duration_stats(column)
+    assert stats.mean == pytest.approx(30.0)
+
+    outliers = detect_outliers_zscore(_DUR_5[::2])
+    assert outliers.shape == (3,)
+
+    fares = calculate_fares(column, table[:, 1], per_minute=0.1, per_km=0.1)
+    assert np.allclose(fares, 0.2 * _DUR_5)
@@ -0,0 +1,130 @@
+"""
+Unit tests for the columnar stores.
+
+Covers:
+    - BikeStore
+    - TripStore
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models import ClassicBike, ElectricBike
+from stores import BikeStore, TripStore
+
+
+# ---------------------------------------------------------------------------
+# BikeStore
+# ---------------------------------------------------------------------------
+
+class TestBikeStore:
+
+    def _frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "bike_id": ["BK001", "BK002"],
+            "bike_type": ["classic", "electric"],
+            "battery_level": [100.0, 80.0],
+            "gear_count": [21, 0],
+        })
+
+    def test_from_dataframe_columns(self) -> None:
+        store = BikeStore.from_dataframe(self._frame())
+        assert len(store) == 2
+        assert store.batteries.dtype == np.float32
+        assert store.types.dtype == np.int8
+        assert list(store.ids) == ["BK001", "BK002"]
+
+    def test_missing_optional_columns_get_defaults(self) -> None:
+        df = pd.DataFrame({
+            "bike_id": ["BK003"],
+            "bike_type": ["classic"],
+        })
+        store = BikeStore.from_dataframe(df)
+        assert store.batteries[0] == 100.0
+        assert store.gears[0] == 7
+        assert store.statuses[0] == 0  # available
+
+    def test_to_bike_round_trip(self) -> None:
+        store = BikeStore.from_dataframe(self._frame())
+        classic = store.to_bike(0)
+        electric = store.to_bike(1)
+        assert isinstance(classic, ClassicBike)
+        assert classic.gear_count == 21
+        assert isinstance(electric, ElectricBike)
+        assert electric.battery_level == 80.0
+
+    def test_from_csv(self, tmp_path) -> None:
+        path = tmp_path / "bikes.csv"
+        self._frame().to_csv(path, index=False)
+        store = BikeStore.from_csv(path)
+        assert len(store) == 2
+
+    def test_mixed_fleet_nan_columns_get_defaults(self) -> None:
+        # A combined CSV leaves NaN in the other type's column
+        df = pd.DataFrame({
+            "bike_id": ["BK001", "BK002"],
+            "bike_type": ["classic", "electric"],
+            "battery_level": [np.nan, 80.0],
+            "gear_count": [21, np.nan],
+        })
+        store = BikeStore.from_dataframe(df)
+        assert store.batteries[0] == 100.0
+        assert store.gears[1] == 7
+        assert store.to_bike(1).battery_level == 80.0
+
+    def test_unknown_bike_type_raises(self) -> None:
+        df = pd.DataFrame({
+            "bike_id": ["BK001"],
+            "bike_type": ["scooter"],
+        })
+        with pytest.raises(ValueError, match="scooter"):
+            BikeStore.from_dataframe(df)
+
+    def test_unknown_status_raises(self) -> None:
+        # NaN and an unknown string in the same column must still
+        # produce the ValueError, not crash while formatting it
+        df = pd.DataFrame({
+            "bike_id": ["BK001", "BK002"],
+            "bike_type": ["classic", "classic"],
+            "status": [np.nan, "broken"],
+        })
+        with pytest.raises(ValueError, match="broken"):
+            BikeStore.from_dataframe(df)
+
+
+# ---------------------------------------------------------------------------
+# TripStore
+# ---------------------------------------------------------------------------
+
+class TestTripStore:
+
+    def _frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "trip_id": ["TR001", "TR002"],
+            "user_id": ["U001", "U002"],
+            "bike_id": ["BK001", "BK002"],
+            "start_station_id": ["ST001", "ST002"],
+            "end_station_id": ["ST002", "ST001"],
+            "duration_minutes": [12.5, 30.0],
+            "distance_km": [2.1, 5.4],
+        })
+
+    def test_from_dataframe_columns(self) -> None:
+        store = TripStore.from_dataframe(self._frame())
+        assert len(store) == 2
+        assert store.durations.dtype == np.float64
+        assert np.allclose(store.distances, [2.1, 5.4])
+
+    def test_columns_feed_numerical_routines(self) -> None:
+        from numerical import trip_duration_stats
+
+        store = TripStore.from_dataframe(self._frame())
+        stats = trip_duration_stats(store.durations)
+        assert stats.mean == 21.25
+
+    def test_from_csv(self, tmp_path) -> None:
+        path = tmp_path / "trips.csv"
+        self._frame().to_csv(path, index=False)
+        store = TripStore.from_csv(path)
+        assert list(store.ids) == ["TR001", "TR002"]